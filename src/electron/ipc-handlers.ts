@@ -1,13 +1,24 @@
-import { BrowserWindow } from "electron";
-import type { ClientEvent, ServerEvent } from "./types.js";
+import { encodeStreamMessageEvent, type ClientEvent, type ServerEvent } from "./types.js";
 import { runClaude, type RunnerHandle } from "./libs/runner.js";
 import { SessionStore } from "./libs/session-store.js";
-import { app } from "electron";
+import { app, type WebContents } from "electron";
 import { join } from "path";
 
 let sessions: SessionStore;
 const runnerHandles = new Map<string, RunnerHandle>();
 
+// Renderers that receive server events. BrowserWindow.getAllWindows() allocates a new
+// array on every call, so keep our own list and replace it only when windows come and go.
+let eventTargets: readonly WebContents[] = [];
+
+app.on("browser-window-created", (_, win) => {
+  const contents = win.webContents;
+  eventTargets = [...eventTargets, contents];
+  contents.once("destroyed", () => {
+    eventTargets = eventTargets.filter((target) => target !== contents);
+  });
+});
+
 function initializeSessions() {
   if (!sessions) {
     const DB_PATH = join(app.getPath("userData"), "sessions.db");
@@ -16,22 +27,34 @@ function initializeSessions() {
   return sessions;
 }
 
-function broadcast(event: ServerEvent) {
-  const payload = JSON.stringify(event);
-  const windows = BrowserWindow.getAllWindows();
-  for (const win of windows) {
-    win.webContents.send("server-event", payload);
+// Events emitted within the same turn (a burst of stream deltas, a result followed by
+// its status change) are sent to the renderer together as one JSON array frame.
+let pendingFrames: string[] = [];
+
+function broadcast(event: ServerEvent, payload: string = JSON.stringify(event)) {
+  pendingFrames.push(payload);
+  if (pendingFrames.length === 1) {
+    setImmediate(flushFrames);
   }
 }
 
+function flushFrames() {
+  const frames = pendingFrames;
+  pendingFrames = [];
+  const payload = frames.length === 1 ? frames[0] : `[${frames.join(",")}]`;
+  for (const contents of eventTargets) {
+    contents.send("server-event", payload);
+  }
+}
+
+// Only reached through emit, which runs after handleClientEvent has initialized the store.
 function hasLiveSession(sessionId: string): boolean {
-  if (!sessions) return false;
-  return Boolean(sessions.getSession(sessionId));
+  return sessions.getSession(sessionId) !== undefined;
 }
 
 function emit(event: ServerEvent) {
   // If a session was deleted, drop late events that would resurrect it in the UI.
-  // (Session history lookups are DB-backed, so these late events commonly lead to "Unknown session".)
+  // (History is read from the in-memory session map, which no longer has the session, so it could never be hydrated.)
   if (
     (event.type === "session.status" ||
       event.type === "stream.message" ||
@@ -46,7 +69,11 @@ function emit(event: ServerEvent) {
     sessions.updateSession(event.payload.sessionId, { status: event.payload.status });
   }
   if (event.type === "stream.message") {
-    sessions.recordMessage(event.payload.sessionId, event.payload.message);
+    // Encode the SDK message once and reuse it for both the DB row and the IPC frame.
+    const data = JSON.stringify(event.payload.message);
+    sessions.recordMessage(event.payload.sessionId, event.payload.message, data);
+    broadcast(event, encodeStreamMessageEvent(event.payload, data));
+    return;
   }
   if (event.type === "stream.user_prompt") {
     sessions.recordMessage(event.payload.sessionId, {
@@ -4,8 +4,15 @@ import { homedir } from "os";
 import { loadApiConfig, saveApiConfig, type ApiConfig } from "./config-store.js";
 import { app } from "electron";
 
-// Get Claude Code CLI path
+let claudeCodePath: string | null = null;
+
+// Get Claude Code CLI path (fixed for the lifetime of the process)
 export function getClaudeCodePath(): string {
+  claudeCodePath ??= resolveClaudeCodePath();
+  return claudeCodePath;
+}
+
+function resolveClaudeCodePath(): string {
   if (app.isPackaged) {
     // For packaged apps, the SDK needs the explicit path to the CLI
     // The path should point to the unpackaged asar.unpacked directory
@@ -19,14 +26,21 @@ export function getClaudeCodePath(): string {
 }
 
 // 获取当前有效的配置（优先界面配置，回退到文件配置）
+// loadApiConfig hands back the same object until the config changes, so only log
+// when a different config is picked up rather than on every lookup.
+let lastLoggedUiConfig: ApiConfig | null = null;
+
 export function getCurrentApiConfig(): ApiConfig | null {
   const uiConfig = loadApiConfig();
   if (uiConfig) {
-    console.log("[claude-settings] Using UI config:", {
-      baseURL: uiConfig.baseURL,
-      model: uiConfig.model,
-      apiType: uiConfig.apiType
-    });
+    if (uiConfig !== lastLoggedUiConfig) {
+      lastLoggedUiConfig = uiConfig;
+      console.log("[claude-settings] Using UI config:", {
+        baseURL: uiConfig.baseURL,
+        model: uiConfig.model,
+        apiType: uiConfig.apiType
+      });
+    }
     return uiConfig;
   }
 
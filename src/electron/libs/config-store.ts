@@ -13,12 +13,26 @@ export type ApiConfig = {
 
 const CONFIG_FILE_NAME = "api-config.json";
 
+// Last config read from disk; undefined means not loaded yet. Every write to the
+// config file goes through this module, so save/delete simply reset it.
+let cachedConfig: ApiConfig | null | undefined;
+
+let resolvedConfigPath: string | null = null;
+
 function getConfigPath(): string {
-  const userDataPath = app.getPath("userData");
-  return join(userDataPath, CONFIG_FILE_NAME);
+  resolvedConfigPath ??= join(app.getPath("userData"), CONFIG_FILE_NAME);
+  return resolvedConfigPath;
 }
 
 export function loadApiConfig(): ApiConfig | null {
+  if (cachedConfig !== undefined) {
+    return cachedConfig;
+  }
+  cachedConfig = readApiConfig();
+  return cachedConfig;
+}
+
+function readApiConfig(): ApiConfig | null {
   try {
     const configPath = getConfigPath();
     if (!existsSync(configPath)) {
@@ -63,6 +77,7 @@ export function saveApiConfig(config: ApiConfig): void {
     
     // 保存配置 save config
     writeFileSync(configPath, JSON.stringify(config, null, 2), "utf8");
+    cachedConfig = undefined;
     console.info("[config-store] API config saved successfully");
   } catch (error) {
     console.error("[config-store] Failed to save API config:", error);
@@ -75,6 +90,7 @@ export function deleteApiConfig(): void {
     const configPath = getConfigPath();
     if (existsSync(configPath)) {
       unlinkSync(configPath);
+      cachedConfig = undefined;
       console.info("[config-store] API config deleted");
     }
   } catch (error) {
@@ -3,7 +3,6 @@ import type { ServerEvent } from "../types.js";
 import type { Session } from "./session-store.js";
 
 import { getCurrentApiConfig, buildEnvForConfig, getClaudeCodePath} from "./claude-settings.js";
-import { getEnhancedEnv } from "./util.js";
 
 
 export type RunnerOptions = {
@@ -20,6 +19,10 @@ export type RunnerHandle = {
 
 const DEFAULT_CWD = process.cwd();
 
+// Permission request ids only key pendingPermissions and the UI's matching
+// request for the lifetime of this process, so a counter is unique enough.
+let permissionRequestCounter = 0;
+
 
 export async function runClaude(options: RunnerOptions): Promise<RunnerHandle> {
   const { prompt, session, resumeSessionId, onEvent, onSessionUpdate } = options;
@@ -54,11 +57,9 @@ export async function runClaude(options: RunnerOptions): Promise<RunnerHandle> {
       }
       
       // 使用 Anthropic SDK
+      // buildEnvForConfig already layers the config over process.env, which is all
+      // getEnhancedEnv would add (at the cost of a second config read).
       const env = buildEnvForConfig(config);
-      const mergedEnv = {
-        ...getEnhancedEnv(),
-        ...env
-      };
       
       const q = query({
         prompt,
@@ -66,7 +67,7 @@ export async function runClaude(options: RunnerOptions): Promise<RunnerHandle> {
           cwd: session.cwd ?? DEFAULT_CWD,
           resume: resumeSessionId,
           abortController,
-          env: mergedEnv,
+          env,
           pathToClaudeCodeExecutable: getClaudeCodePath(),
           permissionMode: "bypassPermissions",
           includePartialMessages: true,
@@ -74,28 +75,33 @@ export async function runClaude(options: RunnerOptions): Promise<RunnerHandle> {
           canUseTool: async (toolName, input, { signal }) => {
             // For AskUserQuestion, we need to wait for user response
             if (toolName === "AskUserQuestion") {
-              const toolUseId = crypto.randomUUID();
+              const toolUseId = `permission-${++permissionRequestCounter}`;
 
               // Send permission request to frontend
               sendPermissionRequest(toolUseId, toolName, input);
 
               // Create a promise that will be resolved when user responds
               return new Promise<PermissionResult>((resolve) => {
+                const onAbort = () => {
+                  session.pendingPermissions.delete(toolUseId);
+                  resolve({ behavior: "deny", message: "Session aborted" });
+                };
+
                 session.pendingPermissions.set(toolUseId, {
                   toolUseId,
                   toolName,
                   input,
                   resolve: (result) => {
+                    // Answered: the abort listener would otherwise stay attached to
+                    // the signal (pinning this closure) for the rest of the session.
+                    signal.removeEventListener("abort", onAbort);
                     session.pendingPermissions.delete(toolUseId);
                     resolve(result as PermissionResult);
                   }
                 });
 
                 // Handle abort
-                signal.addEventListener("abort", () => {
-                  session.pendingPermissions.delete(toolUseId);
-                  resolve({ behavior: "deny", message: "Session aborted" });
-                });
+                signal.addEventListener("abort", onAbort, { once: true });
               });
             }
 
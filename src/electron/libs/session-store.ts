@@ -16,6 +16,8 @@ export type Session = {
   cwd?: string;
   allowedTools?: string;
   lastPrompt?: string;
+  createdAt: number;
+  updatedAt: number;
   pendingPermissions: Map<string, PendingPermission>;
   abortController?: AbortController;
 };
@@ -32,33 +34,115 @@ export type StoredSession = {
   updatedAt: number;
 };
 
+type PendingMessage = {
+  id: string;
+  sessionId: string;
+  data: string;
+  createdAt: number;
+};
+
 export type SessionHistory = {
   session: StoredSession;
   messages: StreamMessage[];
 };
 
+// Session fields that persistSession writes through, mapped to their columns.
+const UPDATABLE_COLUMNS = {
+  claudeSessionId: "claude_session_id",
+  status: "status",
+  cwd: "cwd",
+  allowedTools: "allowed_tools",
+  lastPrompt: "last_prompt"
+} as const;
+
+// Sessions and stored rows are built in one place with every field present and in
+// declaration order, so V8 keeps them on a single hidden class instead of
+// transitioning shapes as optional fields get assigned later.
+function createSessionObject(fields: Omit<Session, "pendingPermissions" | "abortController">): Session {
+  return {
+    id: fields.id,
+    title: fields.title,
+    claudeSessionId: fields.claudeSessionId,
+    status: fields.status,
+    cwd: fields.cwd,
+    allowedTools: fields.allowedTools,
+    lastPrompt: fields.lastPrompt,
+    createdAt: fields.createdAt,
+    updatedAt: fields.updatedAt,
+    pendingPermissions: new Map(),
+    abortController: undefined
+  };
+}
+
+// better-sqlite3 already hands back TEXT columns as strings and INTEGER columns as
+// numbers, so rows only need null -> undefined mapping, not per-value coercion.
+type SessionRow = {
+  id: string;
+  title: string;
+  claude_session_id: string | null;
+  status: SessionStatus;
+  cwd: string | null;
+  allowed_tools: string | null;
+  last_prompt: string | null;
+  created_at: number;
+  updated_at: number;
+};
+
+function snapshotSession(session: Session): StoredSession {
+  return {
+    id: session.id,
+    title: session.title,
+    status: session.status,
+    cwd: session.cwd,
+    allowedTools: session.allowedTools,
+    lastPrompt: session.lastPrompt,
+    claudeSessionId: session.claudeSessionId,
+    createdAt: session.createdAt,
+    updatedAt: session.updatedAt
+  };
+}
+
 export class SessionStore {
   private sessions = new Map<string, Session>();
   private db: Database.Database;
+  private pendingMessages: PendingMessage[] = [];
+  private flushScheduled = false;
+  private insertMessages: Database.Transaction<(rows: PendingMessage[]) => void>;
+  private updateStatements = new Map<string, Database.Statement>();
+  private selectMessages: Database.Statement;
 
   constructor(dbPath: string) {
     this.db = new Database(dbPath);
     this.initialize();
+    // Compiled once and reused by every flush; each batch is a single transaction,
+    // so a burst of streamed messages costs one WAL commit instead of one per row.
+    const insertMessage = this.db.prepare(
+      `insert or ignore into messages (id, session_id, data, created_at) values (?, ?, ?, ?)`
+    );
+    this.insertMessages = this.db.transaction((rows: PendingMessage[]) => {
+      for (const row of rows) {
+        insertMessage.run(row.id, row.sessionId, row.data, row.createdAt);
+      }
+    });
+    this.selectMessages = this.db
+      .prepare(`select data from messages where session_id = ? order by created_at asc`)
+      .pluck();
     this.loadSessions();
   }
 
   createSession(options: { cwd?: string; allowedTools?: string; prompt?: string; title: string }): Session {
     const id = crypto.randomUUID();
     const now = Date.now();
-    const session: Session = {
+    const session = createSessionObject({
       id,
       title: options.title,
       status: "idle",
       cwd: options.cwd,
       allowedTools: options.allowedTools,
       lastPrompt: options.prompt,
-      pendingPermissions: new Map()
-    };
+      createdAt: now,
+      updatedAt: now
+    });
     this.sessions.set(id, session);
     this.db
       .prepare(
@@ -85,24 +169,10 @@ export class SessionStore {
   }
 
   listSessions(): StoredSession[] {
-    const rows = this.db
-      .prepare(
-        `select id, title, claude_session_id, status, cwd, allowed_tools, last_prompt, created_at, updated_at
-         from sessions
-         order by updated_at desc`
-      )
-      .all() as Array<Record<string, unknown>>;
-    return rows.map((row) => ({
-      id: String(row.id),
-      title: String(row.title),
-      status: row.status as SessionStatus,
-      cwd: row.cwd ? String(row.cwd) : undefined,
-      allowedTools: row.allowed_tools ? String(row.allowed_tools) : undefined,
-      lastPrompt: row.last_prompt ? String(row.last_prompt) : undefined,
-      claudeSessionId: row.claude_session_id ? String(row.claude_session_id) : undefined,
-      createdAt: Number(row.created_at),
-      updatedAt: Number(row.updated_at)
-    }));
+    // The in-memory map holds every row (loaded at startup, updated by every write),
+    // so the list is served from it rather than re-read from the database.
+    return Array.from(this.sessions.values(), snapshotSession)
+      .sort((a, b) => b.updatedAt - a.updatedAt);
   }
 
   listRecentCwds(limit = 8): string[] {
@@ -115,39 +185,22 @@ export class SessionStore {
          order by latest desc
          limit ?`
       )
-      .all(limit) as Array<Record<string, unknown>>;
-    return rows.map((row) => String(row.cwd));
+      .all(limit) as Array<{ cwd: string }>;
+    return rows.map((row) => row.cwd);
   }
 
   getSessionHistory(id: string): SessionHistory | null {
-    const sessionRow = this.db
-      .prepare(
-        `select id, title, claude_session_id, status, cwd, allowed_tools, last_prompt, created_at, updated_at
-         from sessions
-         where id = ?`
-      )
-      .get(id) as Record<string, unknown> | undefined;
-    if (!sessionRow) return null;
+    // Session metadata comes from the in-memory mirror; only the messages need a query.
+    const session = this.sessions.get(id);
+    if (!session) return null;
 
-    const messages = (this.db
-      .prepare(
-        `select data from messages where session_id = ? order by created_at asc`
-      )
-      .all(id) as Array<Record<string, unknown>>)
-      .map((row) => JSON.parse(String(row.data)) as StreamMessage);
+    this.flushMessages();
+    const rows = this.selectMessages.all(id) as string[];
+    // Each row is a JSON document, so decode the whole history as one array.
+    const messages = JSON.parse(`[${rows.join(",")}]`) as StreamMessage[];
 
     return {
-      session: {
-        id: String(sessionRow.id),
-        title: String(sessionRow.title),
-        status: sessionRow.status as SessionStatus,
-        cwd: sessionRow.cwd ? String(sessionRow.cwd) : undefined,
-        allowedTools: sessionRow.allowed_tools ? String(sessionRow.allowed_tools) : undefined,
-        lastPrompt: sessionRow.last_prompt ? String(sessionRow.last_prompt) : undefined,
-        claudeSessionId: sessionRow.claude_session_id ? String(sessionRow.claude_session_id) : undefined,
-        createdAt: Number(sessionRow.created_at),
-        updatedAt: Number(sessionRow.updated_at)
-      },
+      session: snapshotSession(session),
       messages
     };
   }
@@ -156,7 +209,7 @@ export class SessionStore {
     const session = this.sessions.get(id);
     if (!session) return undefined;
     Object.assign(session, updates);
-    this.persistSession(id, updates);
+    this.persistSession(session, updates);
     return session;
   }
 
@@ -166,16 +219,31 @@ export class SessionStore {
     session.abortController = controller;
   }
 
-  recordMessage(sessionId: string, message: StreamMessage): void {
+  recordMessage(sessionId: string, message: StreamMessage, data: string = JSON.stringify(message)): void {
     const id = ('uuid' in message && message.uuid) ? String(message.uuid) : crypto.randomUUID();
-    this.db
-      .prepare(
-        `insert or ignore into messages (id, session_id, data, created_at) values (?, ?, ?, ?)`
-      )
-      .run(id, sessionId, JSON.stringify(message), Date.now());
+    // Queue the row and write it once the current burst of SDK messages has been
+    // handled, so persistence doesn't sit between one streamed message and the next.
+    this.pendingMessages.push({ id, sessionId, data, createdAt: Date.now() });
+    if (!this.flushScheduled) {
+      this.flushScheduled = true;
+      setImmediate(() => this.flushMessages());
+    }
+  }
+
+  private flushMessages(): void {
+    this.flushScheduled = false;
+    if (this.pendingMessages.length === 0) return;
+    const batch = this.pendingMessages;
+    this.pendingMessages = [];
+    try {
+      this.insertMessages(batch);
+    } catch (error) {
+      console.error("[session-store] Failed to persist messages:", error);
+    }
   }
 
   deleteSession(id: string): boolean {
+    this.flushMessages();
     const existing = this.sessions.get(id);
     if (existing) {
       this.sessions.delete(id);
@@ -186,19 +254,12 @@ export class SessionStore {
     return removedFromDb || Boolean(existing);
   }
 
-  private persistSession(id: string, updates: Partial<Session>): void {
+  private persistSession(session: Session, updates: Partial<Session>): void {
     const fields: string[] = [];
     const values: Array<string | number | null> = [];
-    const updatable = {
-      claudeSessionId: "claude_session_id",
-      status: "status",
-      cwd: "cwd",
-      allowedTools: "allowed_tools",
-      lastPrompt: "last_prompt"
-    } as const;
 
-    for (const key of Object.keys(updates) as Array<keyof typeof updatable>) {
-      const column = updatable[key];
+    for (const key of Object.keys(updates) as Array<keyof typeof UPDATABLE_COLUMNS>) {
+      const column = UPDATABLE_COLUMNS[key];
       if (!column) continue;
       fields.push(`${column} = ?`);
       const value = updates[key];
@@ -206,16 +267,30 @@ export class SessionStore {
     }
 
     if (fields.length === 0) return;
+    session.updatedAt = Date.now();
     fields.push("updated_at = ?");
-    values.push(Date.now());
-    values.push(id);
-    this.db
-      .prepare(`update sessions set ${fields.join(", ")} where id = ?`)
-      .run(...values);
+    values.push(session.updatedAt);
+    values.push(session.id);
+
+    // Callers only ever touch a handful of column combinations (status alone,
+    // status + lastPrompt, claudeSessionId, ...), so keep one compiled statement each.
+    const assignments = fields.join(", ");
+    let statement = this.updateStatements.get(assignments);
+    if (!statement) {
+      statement = this.db.prepare(`update sessions set ${assignments} where id = ?`);
+      this.updateStatements.set(assignments, statement);
+    }
+    statement.run(...values);
   }
 
   private initialize(): void {
     this.db.exec(`pragma journal_mode = WAL;`);
+    // In WAL mode NORMAL only syncs at checkpoints; a crash can lose the last few
+    // transactions but never corrupts the database, which is fine for chat history.
+    this.db.exec(`pragma synchronous = NORMAL;`);
+    this.db.exec(`pragma temp_store = memory;`);
+    this.db.exec(`pragma cache_size = -64000;`);
+    this.db.exec(`pragma mmap_size = 268435456;`);
     this.db.exec(
       `create table if not exists sessions (
         id text primary key,
@@ -238,32 +313,44 @@ export class SessionStore {
         foreign key (session_id) references sessions(id)
       )`
     );
-    this.db.exec(`create index if not exists messages_session_id on messages(session_id)`);
+    // (session_id, created_at) serves the history query's ORDER BY straight from the
+    // index and still covers deletes by session_id, so the old single-column index goes.
+    this.db.exec(`drop index if exists messages_session_id`);
+    this.db.exec(
+      `create index if not exists messages_session_id_created_at on messages(session_id, created_at)`
+    );
+    // Partial index matching listRecentCwds' filter so the group-by walks it directly.
+    this.db.exec(
+      `create index if not exists sessions_cwd_updated_at on sessions(cwd, updated_at)
+       where cwd is not null and trim(cwd) != ''`
+    );
   }
 
   private loadSessions(): void {
     const rows = this.db
       .prepare(
-        `select id, title, claude_session_id, status, cwd, allowed_tools, last_prompt
+        `select id, title, claude_session_id, status, cwd, allowed_tools, last_prompt, created_at, updated_at
          from sessions`
       )
-      .all();
-    for (const row of rows as Array<Record<string, unknown>>) {
-      const session: Session = {
-        id: String(row.id),
-        title: String(row.title),
-        claudeSessionId: row.claude_session_id ? String(row.claude_session_id) : undefined,
-        status: row.status as SessionStatus,
-        cwd: row.cwd ? String(row.cwd) : undefined,
-        allowedTools: row.allowed_tools ? String(row.allowed_tools) : undefined,
-        lastPrompt: row.last_prompt ? String(row.last_prompt) : undefined,
-        pendingPermissions: new Map()
-      };
+      .all() as SessionRow[];
+    for (const row of rows) {
+      const session = createSessionObject({
+        id: row.id,
+        title: row.title,
+        claudeSessionId: row.claude_session_id || undefined,
+        status: row.status,
+        cwd: row.cwd || undefined,
+        allowedTools: row.allowed_tools || undefined,
+        lastPrompt: row.last_prompt || undefined,
+        createdAt: row.created_at,
+        updatedAt: row.updated_at
+      });
       this.sessions.set(session.id, session);
     }
   }
 
   close(): void {
+    this.flushMessages();
     this.db.close();
   }
 }
@@ -13,11 +13,8 @@ export function getEnhancedEnv(): Record<string, string | undefined> {
     };
   }
   
-  const env = buildEnvForConfig(config);
-  return {
-    ...process.env,
-    ...env,
-  };
+  // buildEnvForConfig already starts from a copy of process.env
+  return buildEnvForConfig(config);
 }
 
 export const generateSessionTitle = async (userIntent: string | null) => {
@@ -54,8 +51,8 @@ export const generateSessionTitle = async (userIntent: string | null) => {
 
     // Return a simple title based on user input as fallback
     if (userIntent) {
-      const words = userIntent.trim().split(/\s+/).slice(0, 5);
-      return words.join(" ").toUpperCase() + (userIntent.trim().split(/\s+/).length > 5 ? "..." : "");
+      const words = userIntent.trim().split(/\s+/);
+      return words.slice(0, 5).join(" ").toUpperCase() + (words.length > 5 ? "..." : "");
     }
 
     return "New Session";
@@ -13,11 +13,21 @@ electron.contextBridge.exposeInMainWorld("electron", {
     },
     onServerEvent: (callback: (event: any) => void) => {
         const cb = (_: Electron.IpcRendererEvent, payload: string) => {
+            let parsed: any;
             try {
-                const event = JSON.parse(payload);
-                callback(event);
+                parsed = JSON.parse(payload);
             } catch (error) {
                 console.error("Failed to parse server event:", error);
+                return;
+            }
+            // Events emitted in the same main-process turn arrive batched as an array
+            const events = Array.isArray(parsed) ? parsed : [parsed];
+            for (const event of events) {
+                try {
+                    callback(event);
+                } catch (error) {
+                    console.error("Failed to handle server event:", error);
+                }
             }
         };
         electron.ipcRenderer.on("server-event", cb);
@@ -4,33 +4,45 @@ import os from "os"
 import { BrowserWindow } from "electron";
 import { ipcWebContentsSend } from "./util.js";
 
-const POLLING_INTERVAL = 500;
+// Pause between the end of one sample and the start of the next; cpuUsage itself samples for ~1s.
+const POLLING_DELAY = 500;
 
-let pollingIntervalId: ReturnType<typeof setInterval> | null = null;
+let pollingTimeoutId: ReturnType<typeof setTimeout> | null = null;
+let polling = false;
 
 export function pollResources(mainWindow: BrowserWindow): void {
-    pollingIntervalId = setInterval(async () => {
-        if (mainWindow.isDestroyed()) {
-            stopPolling();
-            return;
-        }
-        const cpuUsage = await getCPUUsage();
-        const storageData = getStorageData();
-        const ramUsage = getRamUsage();
+    polling = true;
+    const poll = async () => {
+        try {
+            if (mainWindow.isDestroyed()) {
+                stopPolling();
+                return;
+            }
+            const cpuUsage = await getCPUUsage();
+            const storageData = getStorageData();
+            const ramUsage = getRamUsage();
 
-        if (mainWindow.isDestroyed()) {
-            stopPolling();
-            return;
-        }
+            if (!polling || mainWindow.isDestroyed()) {
+                stopPolling();
+                return;
+            }
 
-        ipcWebContentsSend("statistics", mainWindow.webContents, { cpuUsage, ramUsage, storageData: storageData.usage });
-    }, POLLING_INTERVAL);
+            ipcWebContentsSend("statistics", mainWindow.webContents, { cpuUsage, ramUsage, storageData: storageData.usage });
+        } catch (error) {
+            console.error("Failed to poll resources:", error);
+        } finally {
+            // Re-arm only after the sample finishes so cpuUsage samplers never overlap.
+            if (polling) pollingTimeoutId = setTimeout(poll, POLLING_DELAY);
+        }
+    };
+    pollingTimeoutId = setTimeout(poll, POLLING_DELAY);
 }
 
 export function stopPolling(): void {
-    if (pollingIntervalId) {
-        clearInterval(pollingIntervalId);
-        pollingIntervalId = null;
+    polling = false;
+    if (pollingTimeoutId) {
+        clearTimeout(pollingTimeoutId);
+        pollingTimeoutId = null;
     }
 }
 
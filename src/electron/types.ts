@@ -31,6 +31,19 @@ export type ServerEvent =
   | { type: "permission.request"; payload: { sessionId: string; toolUseId: string; toolName: string; input: unknown } }
   | { type: "runner.error"; payload: { sessionId?: string; message: string } };
 
+type StreamMessagePayload = Extract<ServerEvent, { type: "stream.message" }>["payload"];
+
+// Builds a stream.message frame around message JSON that was already encoded for the DB.
+// `fields` must name every payload key, so adding one above won't compile until it's encoded here.
+export function encodeStreamMessageEvent(payload: StreamMessagePayload, messageJson: string): string {
+  const fields: Record<keyof StreamMessagePayload, string> = {
+    sessionId: JSON.stringify(payload.sessionId),
+    message: messageJson
+  };
+  const encoded = Object.entries(fields).map(([key, value]) => `${JSON.stringify(key)}:${value}`);
+  return `{"type":"stream.message","payload":{${encoded.join(",")}}}`;
+}
+
 // Client -> Server events
 export type ClientEvent =
   | { type: "session.start"; payload: { title: string; prompt: string; cwd?: string; allowedTools?: string } }
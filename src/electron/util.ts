@@ -2,6 +2,7 @@ import { ipcMain, WebContents, WebFrameMain } from "electron";
 import { getUIPath } from "./pathResolver.js";
 import { pathToFileURL } from "url";
 export const DEV_PORT = 5173;
+const DEV_ORIGIN_PREFIX = `http://localhost:${DEV_PORT}/`;
 
 // Checks if you are in development mode
 export function isDev(): boolean {
@@ -21,8 +22,12 @@ export function ipcWebContentsSend<Key extends keyof EventPayloadMapping>(key: K
     webContents.send(key, payload);
 }
 
+// The UI location is fixed for the lifetime of the process, so resolve it once
+let uiFrameUrl: string | null = null;
+
 export function validateEventFrame(frame: WebFrameMain) {
-    if (isDev() && new URL(frame.url).host === `localhost:${DEV_PORT}`) return;
+    if (isDev() && frame.url.startsWith(DEV_ORIGIN_PREFIX)) return;
 
-    if (frame.url !== pathToFileURL(getUIPath()).toString()) throw new Error("Malicious event");
+    uiFrameUrl ??= pathToFileURL(getUIPath()).toString();
+    if (frame.url !== uiFrameUrl) throw new Error("Malicious event");
 }
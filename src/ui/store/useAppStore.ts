@@ -124,15 +124,18 @@ export const useAppStore = create<AppState>((set, get) => ({
         }
 
         if (!state.activeSessionId && event.payload.sessions.length > 0) {
-          const sorted = [...event.payload.sessions].sort((a, b) => {
-            const aTime = a.updatedAt ?? a.createdAt ?? 0;
-            const bTime = b.updatedAt ?? b.createdAt ?? 0;
-            return aTime - bTime;
-          });
-          const latestSession = sorted[sorted.length - 1];
-          if (latestSession) {
-            get().setActiveSessionId(latestSession.id);
+          // Only the most recent session is needed, so scan instead of copying and sorting.
+          let latestSession = event.payload.sessions[0];
+          let latestTime = latestSession.updatedAt ?? latestSession.createdAt ?? 0;
+          for (let i = 1; i < event.payload.sessions.length; i++) {
+            const session = event.payload.sessions[i];
+            const time = session.updatedAt ?? session.createdAt ?? 0;
+            if (time >= latestTime) {
+              latestSession = session;
+              latestTime = time;
+            }
           }
+          get().setActiveSessionId(latestSession.id);
         } else if (state.activeSessionId) {
           const stillExists = event.payload.sessions.some(
             (session) => session.id === state.activeSessionId